@@ -7,46 +7,122 @@ python scripts/prepare_indicators.py --data-dir "Data" --out-dir "data/processed
 """
 
 import argparse
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+# numba is optional; without it the kernels below run as plain Python
+try:
+    from numba import njit
+except Exception:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
-def rsi_wilder(series: pd.Series, period: int = 14) -> pd.Series:
-    delta = series.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-    avg_gain = avg_gain.copy()
-    avg_loss = avg_loss.copy()
-    for i in range(period, len(series)):
-        if i == period:
-            prev_gain = avg_gain.iloc[i]
-            prev_loss = avg_loss.iloc[i]
+@njit(cache=True, error_model="numpy")
+def _rsi_wilder_nb(close, period):
+    n = close.size
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    # seed with the simple average of the first `period` gains/losses
+    ag = 0.0
+    al = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            ag += d
         else:
-            prev_gain = (prev_gain * (period - 1) + gain.iloc[i]) / period
-            prev_loss = (prev_loss * (period - 1) + loss.iloc[i]) / period
-        avg_gain.iloc[i] = prev_gain
-        avg_loss.iloc[i] = prev_loss
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+            al -= d
+    ag /= period
+    al /= period
+    out[period] = 100.0 - 100.0 / (1.0 + ag / al)
+    for i in range(period + 1, n):
+        d = close[i] - close[i - 1]
+        if np.isnan(d):
+            # a missing close poisons every later average, as in the
+            # original .iloc loop; out is already NaN from here on
+            break
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        ag = (ag * (period - 1) + gain) / period
+        al = (al * (period - 1) + loss) / period
+        out[i] = 100.0 - 100.0 / (1.0 + ag / al)
+    return out
+
+@njit(cache=True)
+def _ewm_step(ema, old_wt, xi, alpha):
+    # one step of Series.ewm(adjust=False, ignore_na=False): across a NaN gap
+    # the previous value's weight keeps decaying, as pandas does
+    if np.isnan(ema):
+        return xi, 1.0
+    old_wt *= 1.0 - alpha
+    if np.isnan(xi):
+        return ema, old_wt
+    if ema != xi:
+        ema = (old_wt * ema + alpha * xi) / (old_wt + alpha)
+    return ema, 1.0
+
+@njit(cache=True)
+def _macd_nb(x, alpha_fast, alpha_slow, alpha_signal):
+    # the three Series.ewm(adjust=False) recurrences fused into one pass
+    n = x.size
+    macd = np.empty(n)
+    signal = np.empty(n)
+    hist = np.empty(n)
+    ema_fast = ema_slow = ema_signal = np.nan
+    wt_fast = wt_slow = wt_signal = 1.0
+    for i in range(n):
+        ema_fast, wt_fast = _ewm_step(ema_fast, wt_fast, x[i], alpha_fast)
+        ema_slow, wt_slow = _ewm_step(ema_slow, wt_slow, x[i], alpha_slow)
+        m = ema_fast - ema_slow
+        ema_signal, wt_signal = _ewm_step(ema_signal, wt_signal, m, alpha_signal)
+        macd[i] = m
+        signal[i] = ema_signal
+        hist[i] = m - ema_signal
+    return macd, signal, hist
+
+# part of the cache key; bump whenever compute_indicators' output changes
+_INDICATOR_VERSION = 2
+
+# compile once at import so the first CSV doesn't pay the JIT cost
+_rsi_wilder_nb(np.linspace(1.0, 2.0, 16), 14)
+_macd_nb(np.linspace(1.0, 2.0, 16), 0.5, 0.25, 0.5)
+
+def rsi_wilder(series: pd.Series, period: int = 14) -> pd.Series:
+    close = series.to_numpy(dtype=np.float64)
+    return pd.Series(_rsi_wilder_nb(close, period), index=series.index)
 
 def macd_pandas(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9):
-    ema_fast = series.ewm(span=fast, adjust=False).mean()
-    ema_slow = series.ewm(span=slow, adjust=False).mean()
-    macd = ema_fast - ema_slow
-    macd_signal = macd.ewm(span=signal, adjust=False).mean()
-    macd_hist = macd - macd_signal
-    return macd, macd_signal, macd_hist
-
-def process_file(path: Path, out_dir: Path, use_talib: bool = False):
-    symbol = path.stem.upper()
-    df = pd.read_csv(path, parse_dates=["Date"])
+    close = series.to_numpy(dtype=np.float64)
+    macd, macd_signal, macd_hist = _macd_nb(close, 2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1))
+    return (pd.Series(macd, index=series.index),
+            pd.Series(macd_signal, index=series.index),
+            pd.Series(macd_hist, index=series.index))
+
+def _rolling(values: np.ndarray, window: int, reduce) -> np.ndarray:
+    # reduce a zero-copy (n - window + 1, window) view; NaN for the warm-up
+    # rows, and for any window containing a NaN, like pandas' rolling()
+    out = np.full(values.size, np.nan)
+    if values.size >= window:
+        out[window - 1:] = reduce(sliding_window_view(values, window))
+    return out
+
+def compute_indicators(path: Path, use_talib: bool = False) -> pd.DataFrame:
+    df = pd.read_csv(path, engine="pyarrow", parse_dates=["Date"])
     df = df.sort_values("Date").reset_index(drop=True)
     df["return"] = df["Close"].pct_change()
-    df["MA20"] = df["Close"].rolling(20).mean()
-    df["MA50"] = df["Close"].rolling(50).mean()
-    df["volatility_20d"] = df["return"].rolling(20).std()
+    close = df["Close"].to_numpy(dtype=np.float64)
+    ret = df["return"].to_numpy(dtype=np.float64)
+    df["MA20"] = _rolling(close, 20, lambda w: w.mean(axis=1))
+    df["MA50"] = _rolling(close, 50, lambda w: w.mean(axis=1))
+    df["volatility_20d"] = _rolling(ret, 20, lambda w: w.std(axis=1, ddof=1))
     if use_talib:
         try:
             import talib  # type: ignore
@@ -62,25 +138,56 @@ def process_file(path: Path, out_dir: Path, use_talib: bool = False):
         df["RSI14"] = rsi_wilder(df["Close"], 14)
         macd, signal, hist = macd_pandas(df["Close"])
         df["MACD"], df["MACD_signal"], df["MACD_hist"] = macd, signal, hist
+    return df
 
-    out_file = out_dir / f"{symbol}_processed.csv"
-    df.to_csv(out_file, index=False)
+def process_file(path: Path, out_dir: Path, use_talib: bool = False, fmt: str = "parquet", force: bool = False):
+    symbol = path.stem.upper()
+    # indicator frames are cached as feather, keyed by the input's content,
+    # the indicator backend and _INDICATOR_VERSION, so unchanged CSVs skip
+    # recomputation
+    key = hashlib.sha1(path.read_bytes())
+    key.update(b"talib" if use_talib else b"pandas")
+    key.update(str(_INDICATOR_VERSION).encode())
+    cache_dir = out_dir / ".cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"{symbol}_{key.hexdigest()[:12]}.feather"
+    if cache_file.exists() and not force:
+        df = pd.read_feather(cache_file)
+    else:
+        df = compute_indicators(path, use_talib)
+        df.reset_index(drop=True).to_feather(cache_file)
+        # only the newest entry per symbol is ever read again
+        stale = re.compile(re.escape(symbol) + r"_[0-9a-f]{12}\.feather")
+        for old in cache_dir.glob(f"{symbol}_*.feather"):
+            if old != cache_file and stale.fullmatch(old.name):
+                old.unlink(missing_ok=True)
+
+    out_file = out_dir / f"{symbol}_processed.{fmt}"
+    if fmt == "parquet":
+        df.to_parquet(out_file, compression="zstd", index=False)
+    else:
+        df.to_csv(out_file, index=False)
     return out_file
 
-def main(data_dir, out_dir, use_talib=False):
+def main(data_dir, out_dir, use_talib=False, workers=None, fmt="parquet", force=False):
     data_dir = Path(data_dir)
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     csvs = sorted(data_dir.glob("*.csv"))
-    for csv in csvs:
-        print("Processing:", csv)
-        out_file = process_file(csv, out_dir, use_talib)
-        print("Saved:", out_file)
+    # each CSV is independent, so fan the files out across processes
+    worker = partial(process_file, out_dir=out_dir, use_talib=use_talib, fmt=fmt, force=force)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as ex:
+        for csv, out_file in zip(csvs, ex.map(worker, csvs)):
+            print("Processed:", csv)
+            print("Saved:", out_file)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--data-dir", required=True, help="Path to directory containing price CSVs")
-    parser.add_argument("--out-dir", required=True, help="Output directory for processed CSVs")
+    parser.add_argument("--out-dir", required=True, help="Output directory for processed files")
     parser.add_argument("--use-talib", action="store_true", help="Use ta-lib if available")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="parquet", help="Output file format")
+    parser.add_argument("--force", action="store_true", help="Recompute indicators even if a cached result exists")
     args = parser.parse_args()
-    main(args.data_dir, args.out_dir, args.use_talib)
+    main(args.data_dir, args.out_dir, args.use_talib, args.workers, args.format, args.force)
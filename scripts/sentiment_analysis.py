@@ -9,9 +9,21 @@ Usage:
 """
 
 import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+try:
+    import polars as pl  # type: ignore
+except Exception:
+    pl = None
 import re
 # Try to import TextBlob; if unavailable, provide a lightweight fallback shim
 try:
@@ -43,71 +55,406 @@ except Exception:
             # simple normalized polarity in [-1,1]
             polarity = (pos - neg) / max(1, len(words))
             return _Sentiment(polarity)
-from scipy.stats import pearsonr
+from scipy.stats import t as student_t
 
-def compute_polarity(text):
+def _load_polarity_lexicon():
+    # {word: polarity} lookup for the opt-in --lexicon scorer. With TextBlob
+    # installed this is its en-sentiment lexicon scored as a bag of words
+    # (mean over known words, no negation or intensifier rules), so it only
+    # approximates TextBlob; the fallback shim's +1/-1 average is matched exactly.
     try:
-        return TextBlob(str(text)).sentiment.polarity
+        from textblob.en import sentiment as lexicon  # type: ignore
     except Exception:
-        return 0.0
+        polarity_map = {w: 1.0 for w in TextBlob._POS}
+        polarity_map.update({w: -1.0 for w in TextBlob._NEG})
+        return polarity_map, False
+    return {w: float(tags[None][0]) for w, tags in lexicon.items()}, True
+
+_POLARITY_MAP, _AVERAGE_OVER_KNOWN = _load_polarity_lexicon()
+_WORD_RE = re.compile(r"\w+")
+
+def compute_polarity(text):
+    return TextBlob(str(text)).sentiment.polarity
+
+def lexicon_polarity(text):
+    words = _WORD_RE.findall(str(text).lower())
+    scores = [_POLARITY_MAP[w] for w in words if w in _POLARITY_MAP]
+    n = len(scores) if _AVERAGE_OVER_KNOWN else len(words)
+    return sum(scores) / n if n else 0.0
+
+# distinct headlines per worker task when scoring in parallel
+_PARALLEL_CHUNK = 10_000
 
-def aggregate_daily_sentiment(news_df):
+def _score_texts(texts, scorer=compute_polarity):
+    # a per-row map is cheaper than exploding every token into its own row
+    # and grouping back
+    return texts.map(scorer).to_numpy(dtype=np.float64)
+
+def score_headlines(headlines, workers=None, lexicon=False):
+    # wire reprints and boilerplate repeat a lot, so score each distinct
+    # headline once and broadcast the result back by factorized code
+    # convert the whole column to strings once instead of str() per row;
+    # missing headlines score 0 like any headline without lexicon words
+    texts = headlines.fillna('').astype('string')
+    codes, uniques = pd.factorize(texts)
+    uniques = pd.Series(uniques, dtype='string')
+    score = partial(_score_texts, scorer=lexicon_polarity if lexicon else compute_polarity)
+    if workers is not None and workers > 1 and len(uniques) >= _PARALLEL_CHUNK:
+        chunks = [uniques.iloc[i:i + _PARALLEL_CHUNK] for i in range(0, len(uniques), _PARALLEL_CHUNK)]
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            scores = np.concatenate(list(ex.map(score, chunks)))
+    else:
+        scores = score(uniques)
+    polarity = scores[codes]
+    return pd.Series(polarity, index=headlines.index, name='polarity')
+
+def ticker_dtype(*columns):
+    # one categorical dtype shared by news and prices so the (ticker, Date)
+    # merge joins on integer codes
+    names = set()
+    for col in columns:
+        names.update(col.astype('category').cat.categories.astype(str).str.upper())
+    return pd.CategoricalDtype(sorted(names))
+
+def to_ticker(values, dtype=None):
+    # uppercase the few distinct symbols instead of every row, then remap
+    # the row codes onto `dtype`'s categories
+    raw = values.astype('category')
+    upper = raw.cat.categories.astype(str).str.upper()
+    if dtype is None:
+        dtype = pd.CategoricalDtype(sorted(upper.unique()))
+    # the trailing -1 keeps missing values (code -1) missing
+    remap = np.append(dtype.categories.get_indexer(upper), -1)
+    codes = remap[raw.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=dtype), index=values.index)
+
+def aggregate_daily_sentiment(news_df, tickers=None, workers=None, lexicon=False):
     # ensure datetime
     news_df['date'] = pd.to_datetime(news_df['date'], errors='coerce')
-    news_df['ticker'] = news_df['stock'].astype(str).str.upper()
-    news_df['polarity'] = news_df['headline'].apply(compute_polarity)
-
-    news_df['date_only'] = news_df['date'].dt.date
-    agg = (news_df.groupby(['ticker', 'date_only'])
-           .agg(avg_sentiment=('polarity', 'mean'),
-                min_sentiment=('polarity', 'min'),
-                max_sentiment=('polarity', 'max'),
-                news_count=('headline', 'count'))
-           .reset_index()
-           .rename(columns={'date_only': 'Date'}))
-    agg['Date'] = pd.to_datetime(agg['Date'])
+    news_df['ticker'] = to_ticker(news_df['stock'], tickers)
+    news_df['polarity'] = score_headlines(news_df['headline'], workers, lexicon)
+
+    # sort once by (ticker, day) and reduce each run of equal keys in a
+    # single pass instead of one hash groupby per aggregate
+    codes = news_df['ticker'].cat.codes.to_numpy()
+    dated = news_df['date'].notna().to_numpy() & (codes >= 0)
+    codes = codes[dated]
+    days = (news_df['date'].dt.tz_localize(None).dt.normalize()
+            .to_numpy(dtype='datetime64[D]')[dated])
+    order = np.lexsort((days, codes))
+    codes, days = codes[order], days[order]
+    pol = news_df['polarity'].to_numpy(dtype=np.float64)[dated][order]
+    has_headline = news_df['headline'].notna().to_numpy()[dated][order]
+
+    boundary = np.ones(codes.size, dtype=bool)
+    boundary[1:] = (codes[1:] != codes[:-1]) | (days[1:] != days[:-1])
+    starts = np.flatnonzero(boundary)
+    if starts.size:
+        counts = np.diff(np.append(starts, codes.size))
+        sums = np.add.reduceat(pol, starts)
+        mins = np.minimum.reduceat(pol, starts)
+        maxs = np.maximum.reduceat(pol, starts)
+        news_count = np.add.reduceat(has_headline.astype(np.int64), starts)
+    else:
+        counts = sums = mins = maxs = np.empty(0)
+        news_count = np.empty(0, dtype=np.int64)
+
+    agg = pd.DataFrame({
+        'ticker': pd.Categorical.from_codes(codes[starts], dtype=news_df['ticker'].dtype),
+        'Date': pd.to_datetime(days[starts]),
+        'avg_sentiment': sums / counts,
+        'min_sentiment': mins,
+        'max_sentiment': maxs,
+        'news_count': news_count,
+    })
     return agg
 
-def prepare_price_df(price_df):
+def downcast_prices(df):
+    # only the lossless integer downcast: OHLC values are written back to the
+    # merged output, so they keep their source float64 precision
+    if 'Volume' in df.columns:
+        df['Volume'] = pd.to_numeric(df['Volume'], downcast='integer')
+    return df
+
+def prepare_price_df(price_df, tickers=None):
     price_df['Date'] = pd.to_datetime(price_df['Date'])
-    price_df['ticker'] = price_df['ticker'].astype(str).str.upper()
+    price_df['ticker'] = to_ticker(price_df['ticker'], tickers)
     price_df = price_df.sort_values(['ticker','Date']).reset_index(drop=True)
+    price_df = downcast_prices(price_df)
     # compute daily return (close pct change)
-    price_df['daily_return'] = price_df.groupby('ticker')['Close'].pct_change()
+    price_df['daily_return'] = price_df.groupby('ticker', observed=True)['Close'].pct_change()
     return price_df
 
-def merge_and_analyze(price_df, sentiment_df):
-    merged = price_df.merge(sentiment_df, on=['ticker','Date'], how='left')
+def merge_sentiment(price_df, sentiment_df):
+    # both frames come out sorted by (ticker, Date), so joining on the
+    # MultiIndex takes pandas' monotonic (sort-merge) join path
+    keys = ['ticker', 'Date']
+    merged = (price_df.set_index(keys)
+              .join(sentiment_df.set_index(keys), how='left')
+              .reset_index()
+              .reindex(columns=list(price_df.columns) + [c for c in sentiment_df.columns if c not in keys]))
     # fill missing sentiment with 0 and news_count with 0
     merged['avg_sentiment'] = merged['avg_sentiment'].fillna(0.0)
     merged['news_count'] = merged['news_count'].fillna(0).astype(int)
-    # correlation per ticker (Pearson) and global
-    per_ticker_corr = {}
-    for t, grp in merged.groupby('ticker'):
-        tmp = grp.dropna(subset=['daily_return'])
-        if tmp.shape[0] >= 10:
-            r, p = pearsonr(tmp['avg_sentiment'], tmp['daily_return'])
-            per_ticker_corr[t] = {'pearson_r': float(r), 'p_value': float(p), 'n': int(tmp.shape[0])}
-        else:
-            per_ticker_corr[t] = {'pearson_r': None, 'p_value': None, 'n': int(tmp.shape[0])}
+    return merged
+
+def ticker_correlations(merged):
+    # correlation per ticker (Pearson), computed for all tickers at once
+    valid = merged.dropna(subset=['daily_return'])
+    keys = valid['ticker']
+    x_dev = valid['avg_sentiment'] - valid.groupby(keys, observed=True)['avg_sentiment'].transform('mean')
+    y_dev = valid['daily_return'] - valid.groupby(keys, observed=True)['daily_return'].transform('mean')
+    moments = (pd.DataFrame({'xy': x_dev * y_dev, 'xx': x_dev * x_dev, 'yy': y_dev * y_dev})
+               .groupby(keys, observed=True).sum()
+               .reindex(sorted(merged['ticker'].dropna().unique()), fill_value=0.0))
+    n = valid.groupby(keys, observed=True).size().reindex(moments.index, fill_value=0).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.clip(moments['xy'] / np.sqrt(moments['xx'] * moments['yy']), -1.0, 1.0).to_numpy()
+    p = _pearson_p_value(r, n)
+    return {
+        t: ({'pearson_r': float(rt), 'p_value': float(pt), 'n': int(nt)} if nt >= 10
+            else {'pearson_r': None, 'p_value': None, 'n': int(nt)})
+        for t, rt, pt, nt in zip(moments.index, r, p, n)
+    }
+
+def _pearson_p_value(r, n):
+    # two-sided p-value from the t statistic; same as scipy.stats.pearsonr
+    # but vectorized over arrays of r and n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = r * np.sqrt((n - 2) / (1.0 - r * r))
+    return 2 * student_t.sf(np.abs(t_stat), n - 2)
 
+def _fast_pearson(x, y):
+    # closed-form Pearson r without pearsonr's input validation overhead
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_dev = x - x.mean()
+    y_dev = y - y.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = (x_dev @ y_dev) / np.sqrt((x_dev @ x_dev) * (y_dev @ y_dev))
+    r = float(np.clip(r, -1.0, 1.0))
+    return r, float(_pearson_p_value(r, x.size))
+
+def global_correlation(x, y):
+    if len(x) >= 10:
+        return _fast_pearson(x, y)
+    return None, None
+
+def merge_and_analyze(price_df, sentiment_df):
+    merged = merge_sentiment(price_df, sentiment_df)
+    per_ticker_corr = ticker_correlations(merged)
     # global correlation (drop NaNs)
     g = merged.dropna(subset=['daily_return'])
-    if g.shape[0] >= 10:
-        global_r, global_p = pearsonr(g['avg_sentiment'], g['daily_return'])
-    else:
-        global_r, global_p = None, None
-
+    global_r, global_p = global_correlation(g['avg_sentiment'], g['daily_return'])
     return merged, per_ticker_corr, (global_r, global_p)
 
+def save_correlations(per_ticker_corr, corr_path):
+    corr_df = pd.DataFrame.from_dict(per_ticker_corr, orient='index').reset_index().rename(columns={'index':'ticker'})
+    corr_df.to_csv(corr_path, index=False)
+    return corr_path
+
 def save_outputs(merged_df, per_ticker_corr, global_stats, out_path, corr_path):
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     merged_df.to_csv(out_path, index=False)
     # save correlations
-    corr_df = pd.DataFrame.from_dict(per_ticker_corr, orient='index').reset_index().rename(columns={'index':'ticker'})
-    corr_df.to_csv(corr_path, index=False)
+    save_correlations(per_ticker_corr, corr_path)
     return out_path, corr_path
 
+def is_parquet(path):
+    # a single .parquet file or a (ticker-partitioned) parquet dataset directory
+    path = Path(path)
+    return path.suffix == '.parquet' or path.is_dir()
+
+def is_partitioned_by(path, column):
+    # True for a hive-partitioned dataset directory keyed on `column`; only
+    # then can a per-ticker filter skip files instead of rescanning them all
+    path = Path(path)
+    return path.is_dir() and column in pads.dataset(path, partitioning='hive').partitioning.schema.names
+
+def read_table(path):
+    # parquet outputs of prepare_indicators.py skip CSV parsing entirely
+    if is_parquet(path):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+class _ChunkWriter:
+    # appends per-ticker merged chunks to a CSV or Parquet output file
+    def __init__(self, path):
+        self.path = Path(path)
+        self._parquet = None
+        self._started = False
+
+    def write(self, chunk):
+        # per-chunk categories and downcast ints would otherwise give each
+        # chunk a different schema
+        chunk = chunk.assign(ticker=chunk['ticker'].astype(str))
+        for col in chunk.select_dtypes('integer').columns:
+            chunk[col] = chunk[col].astype(np.int64)
+        if self.path.suffix == '.parquet':
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table.cast(self._parquet.schema))
+        else:
+            chunk.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        self._started = True
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+def _raw_keys_by_ticker(path, column):
+    # parquet filters match stored values exactly, so remember every raw
+    # spelling (e.g. 'aapl', 'AAPL') that normalizes to the same ticker
+    keys = {}
+    for value in pd.read_parquet(path, columns=[column])[column].dropna().unique():
+        keys.setdefault(str(value).upper(), []).append(value)
+    return keys
+
+def _analyze_ticker(price_keys, news_keys, price_path, news_path, lexicon=False):
+    # price_keys=None selects the rows without a ticker, which the in-memory
+    # path also keeps in its output
+    if price_keys is None:
+        price_filter = pc.field('ticker').is_null()
+    else:
+        price_filter = [('ticker', 'in', price_keys)]
+    prices = pd.read_parquet(price_path, filters=price_filter)
+    if news_keys:
+        news = pd.read_parquet(news_path, filters=[('stock', 'in', news_keys)])
+    else:
+        # dataset schema also covers directories and their partition columns
+        news = pads.dataset(news_path, partitioning='hive').schema.empty_table().to_pandas()
+    tickers = ticker_dtype(prices['ticker'], news['stock'])
+    merged = merge_sentiment(prepare_price_df(prices, tickers), aggregate_daily_sentiment(news, tickers, lexicon=lexicon))
+    return merged, ticker_correlations(merged)
+
+def analyze_by_ticker(news_path, price_path, out_path, corr_path, workers=None, lexicon=False):
+    # load, merge and correlate one ticker at a time so peak memory is bounded
+    # by the largest ticker rather than the whole corpus
+    price_keys = _raw_keys_by_ticker(price_path, 'ticker')
+    news_keys = _raw_keys_by_ticker(news_path, 'stock')
+    tickers = sorted(price_keys)
+    # price rows without a ticker go last, where the in-memory sort puts them
+    if pd.read_parquet(price_path, columns=['ticker'])['ticker'].isna().any():
+        tickers.append(None)
+    per_ticker_corr = {}
+    xs, ys = [], []
+    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+    writer = _ChunkWriter(out_path)
+    task = partial(_analyze_ticker, price_path=price_path, news_path=news_path, lexicon=lexicon)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            # keep only a few tickers in flight so finished-but-unwritten
+            # results don't pile up in memory; results are taken in order
+            pending = deque()
+            todo = iter(tickers)
+
+            def submit_next():
+                for t in todo:
+                    pending.append(ex.submit(task, price_keys.get(t), news_keys.get(t, [])))
+                    return
+
+            for _ in range(2 * (workers or os.cpu_count())):
+                submit_next()
+            while pending:
+                merged, corr = pending.popleft().result()
+                submit_next()
+                writer.write(merged)
+                per_ticker_corr.update(corr)
+                valid = merged.dropna(subset=['daily_return'])
+                xs.append(valid['avg_sentiment'].to_numpy(dtype=np.float64))
+                ys.append(valid['daily_return'].to_numpy(dtype=np.float64))
+    finally:
+        writer.close()
+    save_correlations(per_ticker_corr, corr_path)
+    x = np.concatenate(xs) if xs else np.empty(0)
+    y = np.concatenate(ys) if ys else np.empty(0)
+    return global_correlation(x, y)
+
+_UTC_OFFSET_PL = r'^(.*\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(?:Z|[+-]\d{2}:?\d{2})$'
+
+def _to_date_pl(col, dtype):
+    # parse string dates; keep already-temporal columns (e.g. from parquet).
+    # Like tz_localize(None) on the pandas side, the date is the local one:
+    # a trailing UTC offset is dropped rather than converted
+    expr = pl.col(col)
+    if dtype == pl.Utf8 or dtype == pl.String:
+        expr = (expr.str.replace(_UTC_OFFSET_PL, '${1}')
+                .str.to_datetime(strict=False))
+    elif isinstance(dtype, pl.Datetime) and dtype.time_zone is not None:
+        expr = expr.dt.replace_time_zone(None)
+    return expr.cast(pl.Datetime).dt.date()
+
+def aggregate_daily_sentiment_pl(news, lexicon=False):
+    # Polars version of aggregate_daily_sentiment; headlines go through the
+    # same (deduplicating) scorer so both engines report identical polarity
+    polarity = pl.col('headline').map_batches(
+        lambda s: pl.Series(score_headlines(s.to_pandas(), lexicon=lexicon).to_numpy()),
+        return_dtype=pl.Float64)
+    return (news.lazy()
+            .with_columns(_to_date_pl('date', news.schema['date']).alias('Date'),
+                          pl.col('stock').cast(pl.String).str.to_uppercase().alias('ticker'),
+                          polarity.alias('polarity'))
+            .drop_nulls(['Date', 'ticker'])
+            .group_by(['ticker', 'Date'])
+            .agg(avg_sentiment=pl.col('polarity').mean(),
+                 min_sentiment=pl.col('polarity').min(),
+                 max_sentiment=pl.col('polarity').max(),
+                 news_count=pl.col('headline').count())
+            .sort(['ticker', 'Date']))
+
+def prepare_price_df_pl(prices):
+    if 'Volume' in prices.columns:
+        prices = prices.with_columns(prices['Volume'].shrink_dtype())
+    return (prices.lazy()
+            .with_columns(_to_date_pl('Date', prices.schema['Date']).alias('Date'),
+                          pl.col('ticker').cast(pl.String).str.to_uppercase())
+            .sort(['ticker', 'Date'])
+            .with_columns(daily_return=pl.col('Close').pct_change().over('ticker')))
+
+def merge_and_analyze_pl(prices, news, lexicon=False):
+    merged = (prepare_price_df_pl(prices)
+              .join(aggregate_daily_sentiment_pl(news, lexicon), on=['ticker', 'Date'], how='left',
+                    maintain_order='left')
+              .with_columns(pl.col('avg_sentiment').fill_null(0.0),
+                            pl.col('news_count').fill_null(0).cast(pl.Int64))
+              .collect())
+    valid = merged.filter(pl.col('daily_return').is_not_null() & pl.col('daily_return').is_not_nan())
+    stats = (merged.select(pl.col('ticker').drop_nulls().unique())
+             .join(valid.group_by('ticker').agg(n=pl.len(), r=pl.corr('avg_sentiment', 'daily_return')),
+                   on='ticker', how='left')
+             .with_columns(pl.col('n').fill_null(0))
+             .sort('ticker'))
+    r = stats['r'].fill_null(float('nan')).to_numpy()
+    n = stats['n'].to_numpy()
+    p = _pearson_p_value(r, n)
+    per_ticker_corr = {
+        t: ({'pearson_r': float(rt), 'p_value': float(pt), 'n': int(nt)} if nt >= 10
+            else {'pearson_r': None, 'p_value': None, 'n': int(nt)})
+        for t, rt, pt, nt in zip(stats['ticker'].to_list(), r, p, n)
+    }
+    global_stats = global_correlation(valid['avg_sentiment'].to_numpy(), valid['daily_return'].to_numpy())
+    return merged, per_ticker_corr, global_stats
+
+def run_polars(news_path, price_path, out_path, corr_path, lexicon=False):
+    if pl is None:
+        raise ImportError("polars is required for --engine polars")
+    def read(path):
+        if not is_parquet(path):
+            return pl.read_csv(path, try_parse_dates=False)
+        # a pandas-written index is a plain column to polars; drop it as
+        # pd.read_parquet would
+        df = pl.read_parquet(path)
+        return df.drop([c for c in df.columns if c.startswith('__index_level_')])
+    merged, per_ticker_corr, global_stats = merge_and_analyze_pl(read(price_path), read(news_path), lexicon)
+    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+    if Path(out_path).suffix == '.parquet':
+        merged.write_parquet(out_path)
+    else:
+        merged.write_csv(out_path)
+    save_correlations(per_ticker_corr, corr_path)
+    return global_stats
+
 def main(args):
     news_path = Path(args.news)
     price_path = Path(args.prices)
@@ -119,18 +466,35 @@ def main(args):
     if not price_path.exists():
         raise FileNotFoundError(f"Price file not found: {price_path}")
 
-    news = pd.read_csv(news_path)
-    prices = pd.read_csv(price_path)
+    if args.engine == 'polars':
+        print("Merging and computing correlations with Polars...")
+        global_stats = run_polars(news_path, price_path, out_path, corr_path, args.lexicon)
+        out_file, corr_file = out_path, corr_path
+    elif args.per_ticker or (is_partitioned_by(news_path, 'stock') and is_partitioned_by(price_path, 'ticker')):
+        # per-ticker filters only prune partitioned datasets; on single files
+        # every task rescans both inputs, so that is opt-in via --per-ticker
+        if not (is_parquet(news_path) and is_parquet(price_path)):
+            raise ValueError("--per-ticker requires Parquet news and price inputs")
+        print("Merging and computing correlations per ticker...")
+        global_stats = analyze_by_ticker(news_path, price_path, out_path, corr_path, args.workers, args.lexicon)
+        out_file, corr_file = out_path, corr_path
+    else:
+        news = read_table(news_path)
+        prices = read_table(price_path)
+        news['stock'] = news['stock'].astype('category')
+        prices['ticker'] = prices['ticker'].astype('category')
+        tickers = ticker_dtype(prices['ticker'], news['stock'])
 
-    print("Aggregating daily sentiment...")
-    sentiment_daily = aggregate_daily_sentiment(news)
-    print("Preparing price data...")
-    prices_prepared = prepare_price_df(prices)
-    print("Merging and computing correlations...")
-    merged, per_ticker_corr, global_stats = merge_and_analyze(prices_prepared, sentiment_daily)
+        print("Aggregating daily sentiment...")
+        workers = (args.workers or os.cpu_count()) if args.parallel else None
+        sentiment_daily = aggregate_daily_sentiment(news, tickers, workers, args.lexicon)
+        print("Preparing price data...")
+        prices_prepared = prepare_price_df(prices, tickers)
+        print("Merging and computing correlations...")
+        merged, per_ticker_corr, global_stats = merge_and_analyze(prices_prepared, sentiment_daily)
+        out_file, corr_file = save_outputs(merged, per_ticker_corr, global_stats, out_path, corr_path)
 
     print("Global Pearson r:", global_stats)
-    out_file, corr_file = save_outputs(merged, per_ticker_corr, global_stats, out_path, corr_path)
     print("Saved merged dataset to:", out_file)
     print("Saved per-ticker correlations to:", corr_file)
     if global_stats[0] is not None:
@@ -140,8 +504,13 @@ def main(args):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Sentiment analysis + merge with price data")
-    parser.add_argument("--news", required=True, help="Path to cleaned news CSV (news_cleaned.csv)")
-    parser.add_argument("--prices", required=True, help="Path to price indicators CSV (price_indicators.csv)")
-    parser.add_argument("--out", required=True, help="Path to output merged CSV")
+    parser.add_argument("--news", required=True, help="Path to cleaned news CSV or Parquet (news_cleaned.csv)")
+    parser.add_argument("--prices", required=True, help="Path to price indicators CSV or Parquet (price_indicators.csv)")
+    parser.add_argument("--out", required=True, help="Path to output merged CSV (or .parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for per-ticker streaming and for --parallel headline scoring (default: CPU count)")
+    parser.add_argument("--engine", choices=["pandas", "polars"], default="pandas", help="DataFrame engine for the sentiment/price pipeline")
+    parser.add_argument("--lexicon", action="store_true", help="Score headlines with a fast bag-of-words lexicon lookup (approximates TextBlob; ignores negation/intensifiers)")
+    parser.add_argument("--per-ticker", action="store_true", help="Stream Parquet inputs one ticker at a time to bound memory (automatic for ticker-partitioned dataset directories)")
+    parser.add_argument("--parallel", action="store_true", help="Score headlines across --workers processes (in-memory path, i.e. without per-ticker streaming)")
     args = parser.parse_args()
     main(args)
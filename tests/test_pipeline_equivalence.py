@@ -0,0 +1,249 @@
+import argparse
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts import prepare_indicators, sentiment_analysis
+
+try:
+    import polars  # noqa: F401
+    HAS_POLARS = True
+except Exception:
+    HAS_POLARS = False
+
+HEADLINES = [
+    "Stock surges on strong earnings",
+    "Shares fall after weak guidance",
+    "Company announces new product",
+    "Analysts are not happy with the outlook",
+    "Very good quarter for the company",
+    None,  # not '': read_csv would turn that into NaN but parquet keeps it
+]
+
+
+def make_prices(days=40, seed=0):
+    # AAPL and MSFT get news; NVDA gets none. 'msft' checks ticker case folding
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-06-01", periods=days)
+    frames = []
+    for ticker in ("AAPL", "msft", "NVDA"):
+        close = 100 + rng.standard_normal(days).cumsum()
+        frames.append(pd.DataFrame({
+            "Date": dates.strftime("%Y-%m-%d"),
+            "ticker": ticker,
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, days),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def make_news(n=300, seed=1):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-06-01", periods=40)
+    stamps = dates[rng.integers(0, len(dates), n)] + pd.to_timedelta(rng.integers(0, 86_400, n), unit="s")
+    return pd.DataFrame({
+        "headline": np.array(HEADLINES, dtype=object)[rng.integers(0, len(HEADLINES), n)],
+        "date": stamps.strftime("%Y-%m-%d %H:%M:%S-04:00"),
+        "stock": np.array(["AAPL", "aapl", "MSFT", "ZZZ"], dtype=object)[rng.integers(0, 4, n)],
+    })
+
+
+def run(news, prices, out, engine="pandas", per_ticker=False):
+    args = argparse.Namespace(news=str(news), prices=str(prices), out=str(out), workers=2,
+                              engine=engine, lexicon=False, parallel=False, per_ticker=per_ticker)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sentiment_analysis.main(args)
+    merged = pd.read_parquet(out) if out.suffix == ".parquet" else pd.read_csv(out)
+    merged["Date"] = pd.to_datetime(merged["Date"]).dt.strftime("%Y-%m-%d")
+    merged["ticker"] = merged["ticker"].astype(str)
+    corr = pd.read_csv(out.parent / "sentiment_correlations.csv")
+    return merged, corr
+
+
+class TestSentimentEngines(unittest.TestCase):
+    # the in-memory, per-ticker and Polars paths must agree on the same input
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp = Path(cls._tmp.name)
+        cls.prices, cls.news = make_prices(), make_news()
+        # shuffled rows: every path must sort for itself, and the parquet
+        # file carries a non-range pandas index
+        cls.prices = cls.prices.sample(frac=1.0, random_state=0)
+        cls.prices.to_csv(cls.tmp / "prices.csv", index=False)
+        cls.prices.to_parquet(cls.tmp / "prices.parquet")
+        cls.news.to_csv(cls.tmp / "news.csv", index=False)
+        cls.news.to_parquet(cls.tmp / "news.parquet")
+        cls.news.to_parquet(cls.tmp / "news_by_stock", partition_cols=["stock"])
+        cls.prices.to_parquet(cls.tmp / "prices_by_ticker", partition_cols=["ticker"])
+        cls.expected = run(cls.tmp / "news.csv", cls.tmp / "prices.csv", cls.tmp / "memory" / "out.csv")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def assertSameResults(self, actual, expected=None):
+        merged, corr = actual
+        expected_merged, expected_corr = expected or self.expected
+        cols = list(expected_merged.columns)
+        pd.testing.assert_frame_equal(merged[cols], expected_merged, check_dtype=False, rtol=1e-5, atol=1e-6)
+        pd.testing.assert_frame_equal(corr, expected_corr, check_dtype=False, rtol=1e-4)
+
+    def test_reference_run_has_news(self):
+        merged, corr = self.expected
+        self.assertEqual(sorted(merged["ticker"].unique()), ["AAPL", "MSFT", "NVDA"])
+        self.assertGreater((merged["news_count"] > 0).sum(), 0)
+        self.assertEqual(merged.loc[merged["ticker"] == "NVDA", "news_count"].sum(), 0)
+
+    def test_prices_keep_source_precision(self):
+        merged, _ = self.expected
+        # float32 would be off by ~1e-8; allow only the CSV round-trip's last ulp
+        np.testing.assert_allclose(np.sort(merged["Close"]), np.sort(self.prices["Close"]), rtol=1e-12)
+
+    def test_per_ticker_parquet(self):
+        self.assertSameResults(run(self.tmp / "news.parquet", self.tmp / "prices.parquet",
+                                   self.tmp / "per_ticker" / "out.parquet", per_ticker=True))
+
+    def test_plain_parquet_is_read_in_memory(self):
+        # single files can't be pruned per ticker, so only datasets partitioned
+        # on the ticker column stream without --per-ticker
+        self.assertFalse(sentiment_analysis.is_partitioned_by(self.tmp / "prices.parquet", "ticker"))
+        self.assertFalse(sentiment_analysis.is_partitioned_by(self.tmp / "news_by_stock", "ticker"))
+        self.assertTrue(sentiment_analysis.is_partitioned_by(self.tmp / "prices_by_ticker", "ticker"))
+        self.assertSameResults(run(self.tmp / "news.parquet", self.tmp / "prices.parquet",
+                                   self.tmp / "parquet_memory" / "out.csv"))
+
+    def test_partitioned_datasets_stream_per_ticker(self):
+        self.assertSameResults(run(self.tmp / "news_by_stock", self.tmp / "prices_by_ticker",
+                                   self.tmp / "partitioned_both" / "out.parquet"))
+
+    def test_per_ticker_partitioned_news(self):
+        self.assertSameResults(run(self.tmp / "news_by_stock", self.tmp / "prices.parquet",
+                                   self.tmp / "partitioned" / "out.csv", per_ticker=True))
+
+    @unittest.skipUnless(HAS_POLARS, "polars not installed")
+    def test_polars_csv(self):
+        self.assertSameResults(run(self.tmp / "news.csv", self.tmp / "prices.csv",
+                                   self.tmp / "polars_csv" / "out.csv", engine="polars"))
+
+    @unittest.skipUnless(HAS_POLARS, "polars not installed")
+    def test_polars_parquet(self):
+        merged, corr = run(self.tmp / "news.parquet", self.tmp / "prices.parquet",
+                           self.tmp / "polars_parquet" / "out.parquet", engine="polars")
+        self.assertNotIn("__index_level_0__", merged.columns)
+        self.assertSameResults((merged, corr))
+
+    def missing_ticker_prices(self):
+        prices = self.prices.astype({"ticker": object})
+        prices.loc[prices.index[:5], "ticker"] = None
+        return prices
+
+    def test_missing_ticker(self):
+        merged, per_ticker_corr, _ = sentiment_analysis.merge_and_analyze(
+            sentiment_analysis.prepare_price_df(self.missing_ticker_prices()),
+            sentiment_analysis.aggregate_daily_sentiment(self.news))
+        self.assertEqual(sorted(per_ticker_corr), ["AAPL", "MSFT", "NVDA"])
+
+    def test_missing_ticker_per_ticker(self):
+        # rows without a ticker stay in the output of both pandas paths
+        prices = self.missing_ticker_prices()
+        prices.to_csv(self.tmp / "prices_missing.csv", index=False)
+        prices.to_parquet(self.tmp / "prices_missing.parquet")
+        expected = run(self.tmp / "news.csv", self.tmp / "prices_missing.csv", self.tmp / "missing_memory" / "out.csv")
+        self.assertEqual(expected[0]["ticker"].isna().sum(), 5)
+        self.assertSameResults(run(self.tmp / "news.parquet", self.tmp / "prices_missing.parquet",
+                                   self.tmp / "missing_per_ticker" / "out.csv", per_ticker=True), expected)
+
+    @unittest.skipUnless(HAS_POLARS, "polars not installed")
+    def test_missing_ticker_polars(self):
+        import polars as pl
+        merged, per_ticker_corr, _ = sentiment_analysis.merge_and_analyze_pl(
+            pl.from_pandas(self.missing_ticker_prices()), pl.from_pandas(self.news))
+        self.assertEqual(list(per_ticker_corr), ["AAPL", "MSFT", "NVDA"])
+
+
+def reference_rsi(close, period=14):
+    # straightforward Wilder RSI loop
+    delta = close.diff()
+    gain, loss = delta.clip(lower=0), -delta.clip(upper=0)
+    avg_gain = gain.rolling(period, min_periods=period).mean()
+    avg_loss = loss.rolling(period, min_periods=period).mean()
+    for i in range(period + 1, len(close)):
+        avg_gain.iloc[i] = (avg_gain.iloc[i - 1] * (period - 1) + gain.iloc[i]) / period
+        avg_loss.iloc[i] = (avg_loss.iloc[i - 1] * (period - 1) + loss.iloc[i]) / period
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def reference_macd(close, fast=12, slow=26, signal=9):
+    macd = close.ewm(span=fast, adjust=False).mean() - close.ewm(span=slow, adjust=False).mean()
+    macd_signal = macd.ewm(span=signal, adjust=False).mean()
+    return macd, macd_signal, macd - macd_signal
+
+
+class TestIndicators(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.close = pd.Series(100 + rng.standard_normal(120).cumsum())
+
+    def test_rsi_matches_reference(self):
+        np.testing.assert_allclose(prepare_indicators.rsi_wilder(self.close), reference_rsi(self.close),
+                                   rtol=1e-10, equal_nan=True)
+
+    def test_rsi_propagates_nan_gap(self):
+        close = self.close.copy()
+        close.iloc[60] = np.nan
+        rsi = prepare_indicators.rsi_wilder(close)
+        np.testing.assert_allclose(rsi, reference_rsi(close), rtol=1e-10, equal_nan=True)
+        self.assertTrue(rsi.iloc[14:60].notna().all())
+        self.assertTrue(rsi.iloc[60:].isna().all())
+
+    def test_macd_matches_pandas_ewm_across_gaps(self):
+        close = self.close.copy()
+        close.iloc[[0, 30, 31, 75]] = np.nan
+        for actual, expected in zip(prepare_indicators.macd_pandas(close), reference_macd(close)):
+            np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-12, equal_nan=True)
+
+    def test_compute_indicators_matches_pandas(self):
+        df = pd.DataFrame({
+            "Date": pd.bdate_range("2020-01-01", periods=len(self.close)).strftime("%Y-%m-%d"),
+            "Open": self.close, "High": self.close + 1, "Low": self.close - 1, "Close": self.close,
+            "Volume": np.arange(len(self.close)) + 1_000,
+        })
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "aapl.csv"
+            df.iloc[::-1].to_csv(path, index=False)
+            out = prepare_indicators.compute_indicators(path)
+        close = self.close
+        ret = close.pct_change()
+        np.testing.assert_array_equal(out["Close"], close)
+        np.testing.assert_allclose(out["MA20"], close.rolling(20).mean(), rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(out["MA50"], close.rolling(50).mean(), rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(out["volatility_20d"], ret.rolling(20).std(), rtol=1e-8, equal_nan=True)
+        np.testing.assert_allclose(out["RSI14"], reference_rsi(close), rtol=1e-10, equal_nan=True)
+        for col, expected in zip(("MACD", "MACD_signal", "MACD_hist"), reference_macd(close)):
+            np.testing.assert_allclose(out[col], expected, rtol=1e-10, atol=1e-12, equal_nan=True)
+
+    def test_cache_keeps_one_entry_per_symbol(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            path = tmp / "aapl.csv"
+            pd.DataFrame({"Date": ["2020-01-01", "2020-01-02"], "Close": [1.0, 2.0]}).to_csv(path, index=False)
+            (tmp / "out" / ".cache").mkdir(parents=True)
+            (tmp / "out" / ".cache" / "AAPL_0123456789ab.feather").touch()
+            (tmp / "out" / ".cache" / "AAPL_X_0123456789ab.feather").touch()
+            prepare_indicators.process_file(path, tmp / "out", fmt="csv")
+            names = sorted(p.name for p in (tmp / "out" / ".cache").iterdir())
+        self.assertEqual(len(names), 2)
+        self.assertIn("AAPL_X_0123456789ab.feather", names)
+        self.assertNotIn("AAPL_0123456789ab.feather", names)
+
+
+if __name__ == "__main__":
+    unittest.main()